@@ -1,8 +1,14 @@
 """Redis cache management."""
-import json
+import asyncio
 import pickle
-from typing import Any, Optional
+import time
+from collections import OrderedDict, deque
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
 
+import msgpack
+import orjson
 import redis.asyncio as redis
 import structlog
 
@@ -10,24 +16,111 @@ from app.config import settings
 
 logger = structlog.get_logger()
 
+# Bound once at import: these values are read on every cache operation,
+# and module locals skip pydantic's attribute descriptor plus a per-call
+# f-string + utf-8 encode (Redis accepts bytes keys directly).
+_PREFIX = settings.cache_prefix.encode()
+_DEFAULT_TTL = settings.cache_ttl
+
+# Version prefix for msgpack-encoded values so the codec can evolve
+# (and legacy json/pickle entries can be read) without flushing Redis.
+MSGPACK_PREFIX = b"\x01"
+
+
+def _msgpack_default(obj: Any) -> str:
+    """Convert non-native types to strings.
+
+    Aware datetimes are handled natively by the codec (timestamp ext);
+    this only sees naive datetimes, dates, UUIDs and the like.
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    return str(obj)
+
+
+def _encode_value(value: Any) -> bytes:
+    """Serialize a value for storage in Redis."""
+    return MSGPACK_PREFIX + msgpack.packb(
+        value, use_bin_type=True, datetime=True, default=_msgpack_default
+    )
+
+
+def _decode_value(data: bytes) -> Any:
+    """Deserialize a value read from Redis."""
+    if data.startswith(MSGPACK_PREFIX):
+        # timestamp=3 restores timestamp-ext values as aware datetimes
+        return msgpack.unpackb(data[1:], raw=False, timestamp=3)
+    # Legacy entries written before the msgpack codec
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return pickle.loads(data)
+
+
+class L1Cache:
+    """Small in-process TTL + LRU cache used in front of Redis.
+
+    Hot keys are served from a dict lookup instead of a network round
+    trip. Safe without locking because all access happens on the event
+    loop and no operation awaits mid-mutation.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 class CacheManager:
     """Redis cache manager with async support."""
 
     def __init__(self):
         self.redis_client: Optional[redis.Redis] = None
+        self._pool: Optional[redis.ConnectionPool] = None
         self._connected = False
+        self._l1 = L1Cache()
+        # References to in-flight fire-and-forget writes so the tasks
+        # aren't garbage-collected before completing
+        self._pending_writes: deque = deque(maxlen=1024)
 
     async def connect(self):
         """Connect to Redis."""
         try:
-            self.redis_client = redis.from_url(
+            # Explicit pool sized for expected concurrency; redis-py uses
+            # the hiredis C parser automatically since it is installed.
+            self._pool = redis.ConnectionPool.from_url(
                 settings.redis_url,
-                decode_responses=False,  # We'll handle encoding ourselves
+                max_connections=settings.redis_max_connections,
+                decode_responses=False,
                 retry_on_timeout=True,
                 socket_connect_timeout=5,
                 socket_timeout=5,
             )
+            self.redis_client = redis.Redis(connection_pool=self._pool)
             # Test connection
             await self.redis_client.ping()
             self._connected = True
@@ -42,7 +135,10 @@ class CacheManager:
         if self.redis_client:
             try:
                 await self.redis_client.aclose()
+                if self._pool:
+                    await self._pool.disconnect()
                 self._connected = False
+                self._l1.clear()
                 logger.info("Disconnected from Redis cache")
             except Exception as e:
                 logger.error("Error disconnecting from Redis", error=str(e))
@@ -52,63 +148,156 @@ class CacheManager:
         if not self._connected or not self.redis_client:
             return None
 
+        cached = self._l1.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            full_key = f"{settings.cache_prefix}{key}"
+            full_key = _PREFIX + key.encode()
             data = await self.redis_client.get(full_key)
             if data:
-                try:
-                    # Try JSON first (for simple data)
-                    return json.loads(data.decode("utf-8"))
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    # Fall back to pickle for complex objects
-                    return pickle.loads(data)
+                value = _decode_value(data)
+                self._l1.set(key, value, _DEFAULT_TTL)
+                return value
             return None
         except Exception as e:
             logger.warning("Cache get failed", key=key, error=str(e))
             return None
 
+    async def get_and_touch(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
+        """Get value from cache and refresh its TTL in one round trip.
+
+        Uses GETEX (Redis 6.2+) so sliding expiration costs a single
+        atomic command instead of a GET followed by an EXPIRE.
+        """
+        if not self._connected or not self.redis_client:
+            return None
+
+        ttl = ttl or _DEFAULT_TTL
+
+        try:
+            full_key = _PREFIX + key.encode()
+            data = await self.redis_client.getex(full_key, ex=ttl)
+            if data:
+                value = _decode_value(data)
+                self._l1.set(key, value, ttl)
+                return value
+            return None
+        except Exception as e:
+            logger.warning("Cache get_and_touch failed", key=key, error=str(e))
+            return None
+
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache."""
         if not self._connected or not self.redis_client:
             return False
 
         try:
-            full_key = f"{settings.cache_prefix}{key}"
-            ttl = ttl or settings.cache_ttl
-
-            # Try to serialize as JSON first
-            try:
-                data = json.dumps(value, default=str).encode("utf-8")
-            except (TypeError, ValueError):
-                # Fall back to pickle for complex objects
-                data = pickle.dumps(value)
+            full_key = _PREFIX + key.encode()
+            ttl = ttl or _DEFAULT_TTL
 
+            data = _encode_value(value)
             await self.redis_client.setex(full_key, ttl, data)
+            self._l1.set(key, value, ttl)
             return True
         except Exception as e:
             logger.warning("Cache set failed", key=key, error=str(e))
             return False
 
+    def set_nowait(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Schedule a cache set without awaiting the Redis reply.
+
+        For write-through updates whose confirmation nobody reads; the
+        caller returns immediately while the SETEX proceeds in the
+        background. `set` already swallows and logs failures.
+        """
+        if not self._connected or not self.redis_client:
+            return
+
+        self._pending_writes.append(asyncio.create_task(self.set(key, value, ttl)))
+
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values from cache in a single round trip."""
+        if not self._connected or not self.redis_client or not keys:
+            return [None] * len(keys)
+
+        results = [self._l1.get(key) for key in keys]
+        missing = [i for i, value in enumerate(results) if value is None]
+        if not missing:
+            return results
+
+        try:
+            full_keys = [_PREFIX + keys[i].encode() for i in missing]
+            raw = await self.redis_client.mget(full_keys)
+            for i, data in zip(missing, raw):
+                if data is not None:
+                    value = _decode_value(data)
+                    self._l1.set(keys[i], value, _DEFAULT_TTL)
+                    results[i] = value
+            return results
+        except Exception as e:
+            logger.warning("Cache mget failed", key_count=len(keys), error=str(e))
+            return results
+
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set multiple values in cache in a single round trip."""
+        if not self._connected or not self.redis_client or not mapping:
+            return False
+
+        try:
+            ttl = ttl or _DEFAULT_TTL
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    full_key = _PREFIX + key.encode()
+                    pipe.setex(full_key, ttl, _encode_value(value))
+                    self._l1.set(key, value, ttl)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(
+                "Cache mset failed", key_count=len(mapping), error=str(e)
+            )
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         if not self._connected or not self.redis_client:
             return False
 
         try:
-            full_key = f"{settings.cache_prefix}{key}"
+            self._l1.delete(key)
+            full_key = _PREFIX + key.encode()
             result = await self.redis_client.delete(full_key)
             return bool(result)
         except Exception as e:
             logger.warning("Cache delete failed", key=key, error=str(e))
             return False
 
+    async def acquire_lock(self, name: str, token: str, ttl: int = 300) -> bool:
+        """Best-effort distributed lock via SET NX.
+
+        Returns True when the lock was acquired. When Redis is
+        unavailable there is nothing to coordinate against, so the lock
+        is granted (single-worker fallback).
+        """
+        if not self._connected or not self.redis_client:
+            return True
+
+        try:
+            full_key = _PREFIX + f"lock:{name}".encode()
+            acquired = await self.redis_client.set(full_key, token, nx=True, ex=ttl)
+            return bool(acquired)
+        except Exception as e:
+            logger.warning("Lock acquisition failed", name=name, error=str(e))
+            return True
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         if not self._connected or not self.redis_client:
             return False
 
         try:
-            full_key = f"{settings.cache_prefix}{key}"
+            full_key = _PREFIX + key.encode()
             result = await self.redis_client.exists(full_key)
             return bool(result)
         except Exception as e:
@@ -121,11 +310,24 @@ class CacheManager:
             return 0
 
         try:
-            full_pattern = f"{settings.cache_prefix}{pattern}"
-            keys = await self.redis_client.keys(full_pattern)
-            if keys:
-                return await self.redis_client.delete(*keys)
-            return 0
+            # Pattern invalidation is rare (post-sync); dropping the whole
+            # L1 is cheaper than matching patterns against it.
+            self._l1.clear()
+            full_pattern = _PREFIX + pattern.encode()
+            deleted = 0
+            batch: List[bytes] = []
+            # SCAN instead of KEYS so we never block the Redis event loop,
+            # and UNLINK so large batches are freed lazily off-thread.
+            async for key in self.redis_client.scan_iter(
+                match=full_pattern, count=500
+            ):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await self.redis_client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await self.redis_client.unlink(*batch)
+            return deleted
         except Exception as e:
             logger.warning("Cache clear pattern failed", pattern=pattern, error=str(e))
             return 0
@@ -137,8 +339,11 @@ class CacheManager:
                 return {"status": "disconnected", "error": "No Redis client"}
 
             logger.info("Starting cache health check")
-            await self.redis_client.ping()
-            info = await self.redis_client.info()
+            # Pipeline PING + INFO into a single round trip
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.ping()
+                pipe.info()
+                _, info = await pipe.execute()
 
             return {
                 "status": "healthy",
@@ -33,6 +33,7 @@ class Settings(BaseSettings):
 
     # Redis cache settings
     redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = 20
     cache_ttl: int = 3600  # 1 hour
     cache_prefix: str = "rickmorty:"
 
@@ -43,7 +44,24 @@ class Settings(BaseSettings):
     # Observability settings
     metrics_enabled: bool = True
     tracing_enabled: bool = True
+    # Preferred span export: OTLP over gRPC to a collector. The Jaeger
+    # agent endpoint remains as a fallback for environments still
+    # running the (deprecated) Thrift/UDP agent.
+    otlp_endpoint: Optional[str] = None
     jaeger_endpoint: Optional[str] = None
+    # Fraction of root traces sampled; unsampled requests pay only the
+    # sampler decision, not span allocation and export queueing
+    tracing_sample_rate: float = 0.05
+    # Batch spans on the event loop instead of BatchSpanProcessor's
+    # worker thread, which contends with asyncio for the GIL
+    tracing_async_processor: bool = True
+    # Span batching: a larger queue absorbs bursts, a shorter delay
+    # lowers end-to-end trace latency, and a shorter export timeout
+    # fails fast instead of stalling shutdown
+    tracing_bsp_max_queue_size: int = 4096
+    tracing_bsp_schedule_delay_ms: int = 1000
+    tracing_bsp_max_export_batch_size: int = 256
+    tracing_bsp_export_timeout_ms: int = 10000
 
     # Logging settings
     log_level: str = "INFO"
@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import structlog
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -30,12 +31,14 @@ else:
         echo=settings.debug,
     )
 
-# Create async session factory
+# Create async session factory. Autoflush is disabled: the GET endpoints
+# are read-only and would otherwise pay an identity-map dirty scan before
+# every SELECT; the sync writer flushes explicitly before commit.
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
-    autoflush=True,
+    autoflush=False,
 )
 
 
@@ -81,13 +84,17 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+# Prepared once; the liveness probe should not pay statement construction
+_PING = text("SELECT 1")
+
+
 async def check_db_connection() -> bool:
     """Check database connection health."""
     try:
-        from sqlalchemy import text
-
-        async with get_db_session() as session:
-            await session.execute(text("SELECT 1"))
+        # Plain connection instead of a session: a liveness ping does not
+        # need the identity map, autoflush, or commit/rollback machinery.
+        async with engine.connect() as conn:
+            await conn.execute(_PING)
             return True
     except Exception as e:
         logger.error("Database health check failed", error=str(e))
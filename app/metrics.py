@@ -1,4 +1,6 @@
 """Prometheus metrics for monitoring."""
+import os
+import sys
 import time
 from functools import wraps
 from typing import Callable
@@ -6,6 +8,7 @@ from typing import Callable
 import structlog
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
+    CollectorRegistry,
     Counter,
     Gauge,
     Histogram,
@@ -17,6 +20,18 @@ from app.config import settings
 
 logger = structlog.get_logger()
 
+# Under multiple workers (gunicorn/uvicorn --workers N) each process has
+# its own default registry, so scrapes would only see one worker's view.
+# When PROMETHEUS_MULTIPROC_DIR is set, aggregate all workers' metrics
+# from the shared memory-mapped files instead.
+if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    from prometheus_client import multiprocess
+
+    _registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(_registry)
+else:
+    _registry = None
+
 # Application info
 app_info = Info("app_info", "Application information")
 app_info.info(
@@ -139,6 +154,44 @@ circuit_breaker_failures = Counter(
 )
 
 
+# Shared child-handle cache for error counters. Error paths are rare but
+# type(e).__name__ produces a fresh (uninterned) string each time, so the
+# label-tuple hash misses prometheus_client's own child cache; interning
+# the name and memoizing the child reduces the path to a dict get + inc.
+_ERR_CHILD_CACHE: dict = {}
+
+
+def _err(counter: Counter, label: str, exc: BaseException) -> Counter:
+    """Return the memoized (label, error_type) child of an error counter."""
+    error_type = sys.intern(type(exc).__name__)
+    key = (counter, label, error_type)
+    child = _ERR_CHILD_CACHE.get(key)
+    if child is None:
+        # Positional labels follow each counter's declared order
+        # (operation/endpoint first, error_type second)
+        child = _ERR_CHILD_CACHE[key] = counter.labels(label, error_type)
+    return child
+
+
+# Lazily-built child handles per (method, endpoint): in-progress gauge,
+# duration histogram, and a per-status-code counter dict. The endpoint
+# label set is small (route templates), so each request after the first
+# does plain inc/observe calls with no .labels() hashing.
+_REQ_CHILD_CACHE: dict = {}
+
+
+def _request_children(method: str, endpoint: str) -> tuple:
+    key = (method, endpoint)
+    children = _REQ_CHILD_CACHE.get(key)
+    if children is None:
+        children = _REQ_CHILD_CACHE[key] = (
+            request_in_progress.labels(method=method, endpoint=endpoint),
+            request_duration.labels(method=method, endpoint=endpoint),
+            {},
+        )
+    return children
+
+
 def track_request_metrics(func: Callable) -> Callable:
     """Decorator to track HTTP request metrics."""
 
@@ -150,12 +203,17 @@ def track_request_metrics(func: Callable) -> Callable:
             return await func(*args, **kwargs)
 
         method = request.method
-        endpoint = request.url.path
+        # Label by route template (e.g. /characters/{character_id}) so
+        # dynamic paths don't explode series cardinality
+        route = request.scope.get("route")
+        endpoint = getattr(route, "path", None) or request.url.path
 
-        # Track request in progress
-        request_in_progress.labels(method=method, endpoint=endpoint).inc()
+        in_progress_child, duration_child, count_children = _request_children(
+            method, endpoint
+        )
+        in_progress_child.inc()
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         status_code = 200
 
         try:
@@ -169,12 +227,15 @@ def track_request_metrics(func: Callable) -> Callable:
             raise
         finally:
             # Record metrics
-            duration = time.time() - start_time
-            request_count.labels(
-                method=method, endpoint=endpoint, status_code=status_code
-            ).inc()
-            request_duration.labels(method=method, endpoint=endpoint).observe(duration)
-            request_in_progress.labels(method=method, endpoint=endpoint).dec()
+            duration = time.perf_counter() - start_time
+            count_child = count_children.get(status_code)
+            if count_child is None:
+                count_child = count_children[status_code] = request_count.labels(
+                    method=method, endpoint=endpoint, status_code=status_code
+                )
+            count_child.inc()
+            duration_child.observe(duration)
+            in_progress_child.dec()
 
     return wrapper
 
@@ -183,20 +244,20 @@ def track_database_operation(operation: str):
     """Decorator to track database operation metrics."""
 
     def decorator(func: Callable) -> Callable:
+        # Resolve label children once at decoration time; .labels()
+        # hashes the label tuple on every call otherwise.
+        duration_child = database_query_duration.labels(operation=operation)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
-                database_query_duration.labels(operation=operation).observe(duration)
+                duration_child.observe(time.perf_counter() - start_time)
                 return result
             except Exception as e:
-                duration = time.time() - start_time
-                database_query_duration.labels(operation=operation).observe(duration)
-                database_errors.labels(
-                    operation=operation, error_type=type(e).__name__
-                ).inc()
+                duration_child.observe(time.perf_counter() - start_time)
+                _err(database_errors, operation, e).inc()
                 raise
 
         return wrapper
@@ -208,21 +269,21 @@ def track_cache_operation(operation: str):
     """Decorator to track cache operation metrics."""
 
     def decorator(func: Callable) -> Callable:
+        duration_child = cache_duration.labels(operation=operation)
+        success_child = cache_operations.labels(operation=operation, status="success")
+        error_child = cache_operations.labels(operation=operation, status="error")
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            status = "success"
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
-                cache_duration.labels(operation=operation).observe(duration)
-                cache_operations.labels(operation=operation, status=status).inc()
+                duration_child.observe(time.perf_counter() - start_time)
+                success_child.inc()
                 return result
             except Exception:
-                status = "error"
-                duration = time.time() - start_time
-                cache_duration.labels(operation=operation).observe(duration)
-                cache_operations.labels(operation=operation, status=status).inc()
+                duration_child.observe(time.perf_counter() - start_time)
+                error_child.inc()
                 raise
 
         return wrapper
@@ -234,24 +295,26 @@ def track_rick_morty_api_call(endpoint: str):
     """Decorator to track Rick and Morty API calls."""
 
     def decorator(func: Callable) -> Callable:
+        duration_child = rick_morty_api_duration.labels(endpoint=endpoint)
+        success_child = rick_morty_api_requests.labels(
+            endpoint=endpoint, status="success"
+        )
+        failure_child = rick_morty_api_requests.labels(
+            endpoint=endpoint, status="error"
+        )
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            status = "success"
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
-                rick_morty_api_duration.labels(endpoint=endpoint).observe(duration)
-                rick_morty_api_requests.labels(endpoint=endpoint, status=status).inc()
+                duration_child.observe(time.perf_counter() - start_time)
+                success_child.inc()
                 return result
             except Exception as e:
-                status = "error"
-                duration = time.time() - start_time
-                rick_morty_api_duration.labels(endpoint=endpoint).observe(duration)
-                rick_morty_api_requests.labels(endpoint=endpoint, status=status).inc()
-                rick_morty_api_errors.labels(
-                    endpoint=endpoint, error_type=type(e).__name__
-                ).inc()
+                duration_child.observe(time.perf_counter() - start_time)
+                failure_child.inc()
+                _err(rick_morty_api_errors, endpoint, e).inc()
                 raise
 
         return wrapper
@@ -259,14 +322,33 @@ def track_rick_morty_api_call(endpoint: str):
     return decorator
 
 
-async def get_metrics() -> tuple[str, str]:
+# Exposition cache: generate_latest() costs milliseconds per scrape, so
+# bursty scrapes (multiple Prometheus replicas, dashboards) within this
+# window reuse the last rendered buffer.
+_METRICS_CACHE_TTL = 0.25
+_metrics_cache = {"t": 0.0, "body": b""}
+
+
+async def get_metrics() -> tuple[bytes, str]:
     """Get Prometheus metrics in text format."""
+    now = time.monotonic()
+    if now - _metrics_cache["t"] < _METRICS_CACHE_TTL:
+        return _metrics_cache["body"], CONTENT_TYPE_LATEST
+
     try:
-        metrics_data = generate_latest()
-        return metrics_data.decode("utf-8"), CONTENT_TYPE_LATEST
+        # Keep bytes as-is; decoding to str just adds a copy the
+        # response layer would re-encode.
+        if _registry is not None:
+            body = generate_latest(_registry)
+        else:
+            body = generate_latest()
     except Exception as e:
         logger.error("Failed to generate metrics", error=str(e))
-        return "# Error generating metrics\n", "text/plain"
+        return b"# Error generating metrics\n", "text/plain"
+
+    _metrics_cache["body"] = body
+    _metrics_cache["t"] = now
+    return body, CONTENT_TYPE_LATEST
 
 
 def update_business_metrics(characters_count: int):
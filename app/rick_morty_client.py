@@ -1,10 +1,11 @@
 """Rick and Morty API client with retry logic and circuit breaker."""
 import asyncio
 import logging
-from typing import Dict, List, Optional
-from urllib.parse import parse_qs, urljoin, urlparse
+import re
+from typing import AsyncIterator, Dict, List, Optional
 
 import httpx
+import orjson
 import structlog
 from circuitbreaker import circuit
 from tenacity import (
@@ -21,6 +22,11 @@ from app.models import CharacterResponse
 logger = structlog.get_logger()
 
 
+# Case-insensitive match without allocating a lowercased copy of every
+# origin name in the filter loops
+_EARTH_RE = re.compile(r"earth", re.IGNORECASE)
+
+
 class RickMortyAPIError(Exception):
     """Custom exception for Rick and Morty API errors."""
 
@@ -32,14 +38,18 @@ class RickMortyClient:
 
     def __init__(self):
         self.base_url = settings.rick_morty_api_url
+        # Normalized once; per-request urljoin would re-parse both URLs
+        self._base = self.base_url.rstrip("/") + "/"
         self.timeout = settings.rick_morty_timeout
         self.max_retries = settings.rick_morty_max_retries
         self.backoff_factor = settings.rick_morty_backoff_factor
 
-        # HTTP client configuration
+        # HTTP client configuration; HTTP/2 multiplexes the concurrent
+        # page fetches over one connection, so the pool can shrink
         self.client = httpx.AsyncClient(
+            http2=True,
             timeout=httpx.Timeout(self.timeout),
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
             headers={
                 "User-Agent": f"{settings.app_name}/{settings.app_version}",
                 "Accept": "application/json",
@@ -59,10 +69,9 @@ class RickMortyClient:
     )
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Make HTTP request with retry logic and circuit breaker."""
-        # Ensure base_url ends with / and endpoint doesn't start with /
-        base = self.base_url.rstrip("/") + "/"
-        endpoint = endpoint.lstrip("/")
-        url = urljoin(base, endpoint)
+        # Endpoints are always relative path fragments, so plain
+        # concatenation replaces urljoin's full parse of both URLs
+        url = self._base + endpoint.lstrip("/")
 
         try:
             logger.info("Making API request", url=url, params=params)
@@ -124,58 +133,87 @@ class RickMortyClient:
 
         return await self._make_request("character", params)
 
-    async def get_all_filtered_characters(self) -> List[CharacterResponse]:
+    # Bounds concurrent page fetches so we stay polite to the API while
+    # still overlapping round trips
+    _PAGE_FETCH_CONCURRENCY = 5
+
+    async def _iter_filtered_pages(self) -> AsyncIterator[List[Dict]]:
         """
-        Get all characters matching our criteria:
+        Stream raw result pages for characters matching our criteria:
         - Species: Human
         - Status: Alive
-        - Origin: Earth (any variant)
-        """
-        all_characters: List[CharacterResponse] = []
-        page = 1
 
+        The first page reports the total page count, so the remaining
+        pages are fetched concurrently (bounded by a semaphore) and
+        yielded as they arrive. Consumers see memory bounded by the
+        in-flight page window, not the whole catalog, and can overlap
+        their own I/O (e.g. DB writes) with the remaining fetches.
+        """
         logger.info("Starting to fetch filtered characters")
 
-        while True:
-            try:
-                data = await self.get_characters(
-                    page=page, species="Human", status="Alive"
-                )
+        try:
+            first = await self.get_characters(page=1, species="Human", status="Alive")
+        except RickMortyAPIError as e:
+            logger.error("Error fetching characters", page=1, error=str(e))
+            return
 
-                characters = data.get("results", [])
-                if not characters:
-                    break
-
-                earth_characters = self._filter_earth_characters(characters)
-                all_characters.extend(earth_characters)
-                logger.info(
-                    "Processed page",
-                    page=page,
-                    found_characters=len(earth_characters),
-                    total_characters=len(all_characters),
-                )
+        yield first.get("results", [])
 
-                next_page_num = self._extract_next_page_number(data, current_page=page)
-                if not next_page_num:
-                    break
-                page = next_page_num
+        total_pages = first.get("info", {}).get("pages", 1)
+        if total_pages <= 1:
+            return
 
-                # Rate limiting - be nice to the API
-                await asyncio.sleep(0.1)
+        semaphore = asyncio.Semaphore(self._PAGE_FETCH_CONCURRENCY)
 
-            except RickMortyAPIError as e:
-                logger.error("Error fetching characters", page=page, error=str(e))
-                break
-            except Exception as e:
-                logger.error(
-                    "Unexpected error fetching characters", page=page, error=str(e)
+        async def fetch_page(page: int) -> Dict:
+            async with semaphore:
+                return await self.get_characters(
+                    page=page, species="Human", status="Alive"
                 )
-                break
 
-        logger.info(
-            "Finished fetching filtered characters", total_count=len(all_characters)
-        )
-        return all_characters
+        tasks = [
+            asyncio.create_task(fetch_page(page))
+            for page in range(2, total_pages + 1)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                try:
+                    data = await task
+                except Exception as e:
+                    logger.error("Error fetching characters page", error=str(e))
+                    continue
+                yield data.get("results", [])
+        finally:
+            # If the consumer stops early (e.g. an upsert raises and the
+            # generator is closed at the yield), don't leave the
+            # remaining fetches running against the upstream API; also
+            # retrieve any already-failed results so they don't surface
+            # as "Task exception never retrieved" at GC time.
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+    async def iter_filtered_characters(self) -> AsyncIterator[CharacterResponse]:
+        """Stream validated CharacterResponse objects for Earth characters."""
+        async for page in self._iter_filtered_pages():
+            for character in self._filter_earth_characters(page):
+                yield character
+
+    async def iter_filtered_character_rows(self) -> AsyncIterator[Dict]:
+        """Stream Earth characters as flattened row dicts for DB insertion.
+
+        The sync path only flattens fields back out of the model again,
+        so it skips pydantic construction entirely.
+        """
+        async for page in self._iter_filtered_pages():
+            for row in self._filter_earth_character_rows(page):
+                yield row
+
+    async def get_all_filtered_characters(self) -> List[CharacterResponse]:
+        """Get all filtered characters as a list (see iter_filtered_characters)."""
+        return [character async for character in self.iter_filtered_characters()]
 
     def _filter_earth_characters(
         self, characters: List[Dict]
@@ -185,37 +223,57 @@ class RickMortyClient:
         """
         filtered: List[CharacterResponse] = []
         for char_data in characters:
-            origin_name = char_data.get("origin", {}).get("name", "").lower()
-            if "earth" in origin_name:
-                try:
-                    filtered.append(CharacterResponse(**char_data))
-                except Exception as e:
-                    logger.warning(
-                        "Failed to parse character data",
-                        character_id=char_data.get("id"),
-                        error=str(e),
-                    )
+            origin = char_data.get("origin") or {}
+            if not _EARTH_RE.search(origin.get("name") or ""):
+                continue
+            try:
+                filtered.append(CharacterResponse(**char_data))
+            except Exception as e:
+                logger.warning(
+                    "Failed to parse character data",
+                    character_id=char_data.get("id"),
+                    error=str(e),
+                )
         return filtered
 
-    def _extract_next_page_number(
-        self, data: Dict, current_page: int
-    ) -> Optional[int]:
+    def _filter_earth_character_rows(self, characters: List[Dict]) -> List[Dict]:
         """
-        Extract next page number from API response,
-        if available and greater than current.
+        Flatten Earth characters into row dicts matching the Character
+        table, without building pydantic object graphs.
         """
-        next_link = data.get("info", {}).get("next")
-        if not next_link:
-            return None
-        parsed_url = urlparse(next_link)
-        query_params = parse_qs(parsed_url.query)
-        try:
-            next_page_num = int(query_params.get("page", [0])[0])
-        except (ValueError, TypeError):
-            return None
-        if next_page_num <= current_page:
-            return None
-        return next_page_num
+        rows: List[Dict] = []
+        for char_data in characters:
+            origin = char_data.get("origin") or {}
+            if not _EARTH_RE.search(origin.get("name") or ""):
+                continue
+            location = char_data.get("location") or {}
+            try:
+                rows.append(
+                    {
+                        "id": char_data["id"],
+                        "name": char_data["name"],
+                        "status": char_data["status"],
+                        "species": char_data["species"],
+                        "type": char_data.get("type", ""),
+                        "gender": char_data.get("gender", ""),
+                        "origin_name": origin.get("name", ""),
+                        "origin_url": origin.get("url", ""),
+                        "location_name": location.get("name", ""),
+                        "location_url": location.get("url", ""),
+                        "image_url": char_data.get("image", ""),
+                        "episode_urls": orjson.dumps(
+                            char_data.get("episode", [])
+                        ).decode(),
+                        "api_url": char_data.get("url", ""),
+                    }
+                )
+            except KeyError as e:
+                logger.warning(
+                    "Failed to flatten character data",
+                    character_id=char_data.get("id"),
+                    error=str(e),
+                )
+        return rows
 
     async def health_check(self) -> Dict:
         """Check API health."""
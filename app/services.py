@@ -1,10 +1,14 @@
 """Business logic services."""
-import json
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+import orjson
 import structlog
 from sqlalchemy import asc, desc, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.cache import cache
@@ -13,79 +17,157 @@ from app.rick_morty_client import rick_morty_client
 
 logger = structlog.get_logger()
 
+# Columns refreshed on conflict during a sync upsert
+_UPSERT_COLUMNS = (
+    "name",
+    "status",
+    "species",
+    "type",
+    "gender",
+    "origin_name",
+    "origin_url",
+    "location_name",
+    "location_url",
+    "image_url",
+    "episode_urls",
+    "api_url",
+)
+
+# Keep individual INSERT statements bounded for large catalogs
+_UPSERT_CHUNK_SIZE = 500
+
+# Rows accumulated from the streaming client before each upsert; keeps
+# sync memory O(batch) and overlaps DB writes with page fetches
+_SYNC_BATCH_SIZE = 200
+
+# Only the columns FilteredCharacterResponse projects; selecting full
+# ORM rows would also drag the episode_urls TEXT blob across the wire
+# for every list page
+_RESPONSE_COLUMNS = (
+    Character.id,
+    Character.name,
+    Character.status,
+    Character.species,
+    Character.origin_name,
+    Character.image_url,
+    Character.created_at,
+)
+
+
+def _response_from_row(row) -> FilteredCharacterResponse:
+    """Build a response model from a projected row (see _RESPONSE_COLUMNS)."""
+    return FilteredCharacterResponse.model_construct(
+        id=row.id,
+        name=row.name,
+        status=row.status,
+        species=row.species,
+        origin_name=row.origin_name or "",
+        image_url=row.image_url or "",
+        created_at=row.created_at,
+    )
+
+
+# Pre-built ORDER BY clauses for the small fixed set of sort options;
+# unknown combinations fall back to id ascending
+_ORDER = {
+    ("id", "asc"): asc(Character.id),
+    ("id", "desc"): desc(Character.id),
+    ("name", "asc"): asc(Character.name),
+    ("name", "desc"): desc(Character.name),
+    ("created_at", "asc"): asc(Character.created_at),
+    ("created_at", "desc"): desc(Character.created_at),
+}
+_DEFAULT_ORDER_KEY = ("id", "asc")
+
+
+@lru_cache(maxsize=64)
+def _page_query(order_key, offset: int, limit: int):
+    """Build (and memoize) the projected page SELECT for one page shape.
+
+    The service sees a handful of distinct (sort, offset, limit)
+    combinations, so each Select is constructed once and then reused;
+    together with the engine's statement cache the SQL for a given shape
+    is compiled exactly once per process.
+    """
+    return (
+        select(*_RESPONSE_COLUMNS, func.count().over().label("total"))
+        .order_by(_ORDER[order_key])
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+def _response_from_cached(data: Dict) -> FilteredCharacterResponse:
+    """Rebuild a response model from trusted cache data without re-validating.
+
+    model_construct skips pydantic's validators — safe here because the
+    data was produced by model_dump on our own models. The msgpack codec
+    stores datetimes as ISO strings, so created_at is restored first.
+    """
+    created_at = data.get("created_at")
+    if isinstance(created_at, str):
+        data = {**data, "created_at": datetime.fromisoformat(created_at)}
+    return FilteredCharacterResponse.model_construct(**data)
+
+
+async def _upsert_character_rows(db: AsyncSession, rows: List[Dict]) -> None:
+    """Upsert character rows with a single INSERT ... ON CONFLICT per chunk."""
+    insert_fn = (
+        sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    )
+    for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+        chunk = rows[start : start + _UPSERT_CHUNK_SIZE]
+        stmt = insert_fn(Character).values(chunk)
+        set_ = {column: getattr(stmt.excluded, column) for column in _UPSERT_COLUMNS}
+        # One server-side clock read per statement instead of a client
+        # datetime constructed and wire-encoded per chunk
+        set_["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(index_elements=[Character.id], set_=set_)
+        await db.execute(stmt)
+
 
 class CharacterService:
     """Service for managing character data."""
 
     @staticmethod
-    async def sync_characters_from_api(db: AsyncSession) -> int:
-        """Sync characters from Rick and Morty API to database."""
+    async def sync_characters_from_api(
+        db: AsyncSession, *, client=rick_morty_client
+    ) -> int:
+        """Sync characters from Rick and Morty API to database.
+
+        The API client is injectable so tests can pass a fake instead of
+        patching the module attribute.
+        """
         logger.info("Starting character sync from API")
 
         try:
-            # Get filtered characters from API
-            api_characters = await rick_morty_client.get_all_filtered_characters()
-
-            if not api_characters:
+            # Stream characters from the API and upsert them in bounded
+            # batches: memory stays O(batch) and the DB write for batch
+            # k overlaps the HTTP fetches for batch k+1
+            synced_count = 0
+            batch: List[Dict] = []
+
+            # The client pre-flattens rows, so no pydantic models are
+            # built just to be torn apart again here
+            async for row in client.iter_filtered_character_rows():
+                batch.append(row)
+                if len(batch) >= _SYNC_BATCH_SIZE:
+                    await _upsert_character_rows(db, batch)
+                    synced_count += len(batch)
+                    batch = []
+
+            if batch:
+                await _upsert_character_rows(db, batch)
+                synced_count += len(batch)
+
+            if not synced_count:
                 logger.warning("No characters received from API")
                 return 0
 
-            # Convert to database models and upsert
-            synced_count = 0
-            for api_char in api_characters:
-                try:
-                    # Check if character already exists
-                    result = await db.execute(
-                        select(Character).where(Character.id == api_char.id)
-                    )
-                    existing_char = result.scalar_one_or_none()
-
-                    if existing_char:
-                        # Update existing character
-                        existing_char.name = api_char.name
-                        existing_char.status = api_char.status
-                        existing_char.species = api_char.species
-                        existing_char.type = api_char.type
-                        existing_char.gender = api_char.gender
-                        existing_char.origin_name = api_char.origin.name
-                        existing_char.origin_url = api_char.origin.url
-                        existing_char.location_name = api_char.location.name
-                        existing_char.location_url = api_char.location.url
-                        existing_char.image_url = api_char.image
-                        existing_char.episode_urls = json.dumps(api_char.episode)
-                        existing_char.api_url = api_char.url
-                        existing_char.updated_at = datetime.utcnow()
-                    else:
-                        # Create new character
-                        new_char = Character(
-                            id=api_char.id,
-                            name=api_char.name,
-                            status=api_char.status,
-                            species=api_char.species,
-                            type=api_char.type,
-                            gender=api_char.gender,
-                            origin_name=api_char.origin.name,
-                            origin_url=api_char.origin.url,
-                            location_name=api_char.location.name,
-                            location_url=api_char.location.url,
-                            image_url=api_char.image,
-                            episode_urls=json.dumps(api_char.episode),
-                            api_url=api_char.url,
-                        )
-                        db.add(new_char)
-
-                    synced_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        "Failed to sync character",
-                        character_id=api_char.id,
-                        character_name=api_char.name,
-                        error=str(e),
-                    )
-                    continue
-
             await db.commit()
+            # The bulk statement bypasses the ORM, so drop any stale
+            # identity-map state from this session
+            db.expire_all()
 
             # Clear cache after sync
             await cache.clear_pattern("characters:*")
@@ -117,56 +199,42 @@ class CharacterService:
         if cached_result:
             logger.info("Returning cached characters", page=page, per_page=per_page)
             characters_data, total = cached_result
-            characters = [FilteredCharacterResponse(**char) for char in characters_data]
+            characters = [_response_from_cached(char) for char in characters_data]
             return characters, total
 
         try:
-            # Build query
-            query = select(Character)
-
-            # Add sorting
-            if sort_by == "name":
-                order_column = Character.name
-            elif sort_by == "created_at":
-                order_column = Character.created_at
-            else:
-                order_column = Character.id
-
-            if sort_order.lower() == "desc":
-                query = query.order_by(desc(order_column))
-            else:
-                query = query.order_by(asc(order_column))
-
-            # Add pagination
+            # Project only the response columns, with the total folded in
+            # as a window count so page rows and total arrive in one
+            # round trip; the Select itself is memoized per page shape
+            order_key = (sort_by, sort_order.lower())
+            if order_key not in _ORDER:
+                order_key = _DEFAULT_ORDER_KEY
             offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
+            query = _page_query(order_key, offset, per_page)
 
             # Execute query
             result = await db.execute(query)
-            characters = result.scalars().all()
+            rows = result.all()
 
-            # Get total count
-            count_query = select(func.count(Character.id))
-            count_result = await db.execute(count_query)
-            total = count_result.scalar()
+            if rows:
+                total = rows[0].total
+            else:
+                total = 0
+                if offset:
+                    # Page past the end of the data: only now is a
+                    # separate count needed for correct pagination
+                    count_result = await db.execute(
+                        select(func.count(Character.id))
+                    )
+                    total = count_result.scalar() or 0
 
             # Convert to response models
-            character_responses = []
-            for char in characters:
-                response = FilteredCharacterResponse(
-                    id=char.id,
-                    name=char.name,
-                    status=char.status,
-                    species=char.species,
-                    origin_name=char.origin_name or "",
-                    image_url=char.image_url or "",
-                    created_at=char.created_at,
-                )
-                character_responses.append(response)
+            character_responses = [_response_from_row(row) for row in rows]
 
             # Cache the result
             cache_data = ([char.model_dump() for char in character_responses], total)
-            await cache.set(cache_key, cache_data, ttl=300)  # Cache for 5 minutes
+            # Write-through without blocking the response on the Redis RTT
+            cache.set_nowait(cache_key, cache_data, ttl=300)  # Cache for 5 minutes
 
             logger.info(
                 "Retrieved characters from database",
@@ -188,37 +256,27 @@ class CharacterService:
     ) -> Optional[FilteredCharacterResponse]:
         """Get a single character by ID."""
 
-        # Check cache first
+        # Check cache first; refresh the TTL so hot characters stay warm
         cache_key = f"character:{character_id}"
-        cached_char = await cache.get(cache_key)
+        cached_char = await cache.get_and_touch(cache_key, ttl=3600)
 
         if cached_char:
             logger.info("Returning cached character", character_id=character_id)
-            return FilteredCharacterResponse(**cached_char)
+            return _response_from_cached(cached_char)
 
         try:
             result = await db.execute(
-                select(Character).where(Character.id == character_id)
+                select(*_RESPONSE_COLUMNS).where(Character.id == character_id)
             )
-            character = result.scalar_one_or_none()
+            row = result.one_or_none()
 
-            if not character:
+            if row is None:
                 return None
 
-            response = FilteredCharacterResponse(
-                id=character.id,
-                name=character.name,
-                status=character.status,
-                species=character.species,
-                origin_name=character.origin_name or "",
-                image_url=character.image_url or "",
-                created_at=character.created_at,
-            )
+            response = _response_from_row(row)
 
-            # Cache the result
-            await cache.set(
-                cache_key, response.model_dump(), ttl=3600
-            )  # Cache for 1 hour
+            # Cache the result without blocking on the Redis RTT
+            cache.set_nowait(cache_key, response.model_dump(), ttl=3600)
 
             logger.info("Retrieved character by ID", character_id=character_id)
             return response
@@ -241,39 +299,39 @@ class CharacterService:
             return cached_stats
 
         try:
-            # Total count
-            total_query = select(func.count(Character.id))
-            total_result = await db.execute(total_query)
-            total_count = total_result.scalar()
-
-            # Count by species
-            species_query = select(
-                Character.species, func.count(Character.id)
-            ).group_by(Character.species)
-            species_result = await db.execute(species_query)
-            species_counts: Dict[str, int] = dict(species_result.all())
-
-            # Count by status
-            status_query = select(Character.status, func.count(Character.id)).group_by(
-                Character.status
-            )
-            status_result = await db.execute(status_query)
-            status_counts: Dict[str, int] = dict(status_result.all())
-
-            # Most recent sync
-            latest_query = select(func.max(Character.updated_at))
-            latest_result = await db.execute(latest_query)
-            last_sync = latest_result.scalar()
+            # One round trip: a single (species, status) group-by with a
+            # per-group max(updated_at), from which the total, both
+            # breakdowns and the last sync time are derived in Python
+            breakdown_query = select(
+                Character.species,
+                Character.status,
+                func.count(),
+                func.max(Character.updated_at),
+            ).group_by(Character.species, Character.status)
+            breakdown_result = await db.execute(breakdown_query)
+
+            total_count = 0
+            last_sync = None
+            species_counts: Counter = Counter()
+            status_counts: Counter = Counter()
+            for species, status, count, updated_at in breakdown_result.all():
+                total_count += count
+                species_counts[species] += count
+                status_counts[status] += count
+                if last_sync is None or (
+                    updated_at is not None and updated_at > last_sync
+                ):
+                    last_sync = updated_at
 
             stats = {
                 "total_characters": total_count,
-                "species_breakdown": species_counts,
-                "status_breakdown": status_counts,
+                "species_breakdown": dict(species_counts),
+                "status_breakdown": dict(status_counts),
                 "last_sync": last_sync.isoformat() if last_sync else None,
             }
 
-            # Cache stats for 10 minutes
-            await cache.set(cache_key, stats, ttl=600)
+            # Cache stats for 10 minutes, off the critical path
+            cache.set_nowait(cache_key, stats, ttl=600)
 
             logger.info("Generated character stats", total_characters=total_count)
             return stats
@@ -282,6 +340,26 @@ class CharacterService:
             logger.error("Failed to get character stats", error=str(e))
             raise
 
+    @staticmethod
+    async def get_stats_json(db: AsyncSession) -> bytes:
+        """Get character statistics as pre-encoded JSON bytes.
+
+        Cache hits skip re-serialization entirely: the rendered payload
+        is stored alongside the dict form and handed straight to the
+        response layer.
+        """
+        cache_key = "character_stats:json"
+        cached_payload = await cache.get(cache_key)
+
+        if cached_payload is not None:
+            logger.info("Returning cached character stats JSON")
+            return cached_payload
+
+        stats = await CharacterService.get_stats(db)
+        payload = orjson.dumps(stats)
+        cache.set_nowait(cache_key, payload, ttl=600)
+        return payload
+
 
 # Global service instance
 character_service = CharacterService()
@@ -1,48 +1,109 @@
 """Test configuration and fixtures."""
 import asyncio
 import os
+from types import MappingProxyType
 
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
 
+from app import cache as cache_module
 from app.cache import cache
 from app.config import settings
 from app.database import get_db
 from app.main import app
-from app.models import Base
+from app.models import Base, Character
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# In-memory shared-cache database: no disk I/O, no fsync, and every
+# connection sees the same schema. Under pytest-xdist each worker names
+# its own database; workers are separate processes so shared-cache
+# state cannot cross them anyway, but the distinct URL keeps engine
+# logs unambiguous.
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+TEST_DATABASE_URL = (
+    f"sqlite+aiosqlite:///file:testdb_{_WORKER}?mode=memory&cache=shared&uri=true"
+)
 
-# Create test engine
+# Create test engine; the generous statement cache means each service
+# query is compiled once for the whole run instead of once per test
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     poolclass=StaticPool,
     connect_args={"check_same_thread": False},
+    query_cache_size=1200,
     echo=False,
 )
 
-TestAsyncSessionLocal = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+
+@event.listens_for(test_engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Drop durability guarantees that only cost time in tests.
+
+    Also disable the driver's implicit transaction handling, which
+    otherwise breaks the SAVEPOINTs the rollback fixtures rely on.
+    """
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _do_begin(conn):
+    """Emit BEGIN ourselves since driver-level autobegin is disabled."""
+    conn.exec_driver_sql("BEGIN")
+
+
+def _session_for(connection) -> AsyncSession:
+    """Session joining the per-test transaction; commits become SAVEPOINTs."""
+    return AsyncSession(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+# Active test connection, set by db_connection for each test so the
+# app-side dependency override joins the same transaction without
+# re-installing dependency_overrides per test. A plain module global
+# suffices: tests run sequentially on one event loop (and contextvars
+# don't cross pytest-asyncio's fixture/test task boundary).
+_test_connection = None
 
 
 async def override_get_db():
-    """Override database dependency for testing."""
-    async with TestAsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    """Yield a session bound to the active test transaction."""
+    session = _session_for(_test_connection)
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def reset_rate_limiter():
+    """Flush rate-limit counters persisted by previous runs.
+
+    The limiter's fixed windows live in Redis and outlive the process,
+    so with a local Redis a quick re-run would 429 on /sync (1/minute)
+    and flake on /healthcheck and /stats. The in-memory fallback needs
+    no reset — it dies with the process, as does the storage when Redis
+    is unreachable.
+    """
+    try:
+        app.state.limiter.reset()
+    except Exception:
+        pass
+    yield
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -55,47 +116,68 @@ def event_loop():
 
 @pytest_asyncio.fixture(scope="session")
 async def setup_database():
-    """Set up test database."""
+    """Set up test database and install the session-wide DB override."""
     # Create tables
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    app.dependency_overrides[get_db] = override_get_db
+
     yield
 
     # Clean up
+    app.dependency_overrides.pop(get_db, None)
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
     await test_engine.dispose()
 
 
-@pytest_asyncio.fixture
-async def db_session(setup_database):
-    """Create a test database session."""
-    async with TestAsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            # Clean up all data after each test
-            async with test_engine.begin() as conn:
-                await conn.run_sync(Base.metadata.drop_all)
-                await conn.run_sync(Base.metadata.create_all)
+@pytest_asyncio.fixture(scope="session")
+async def connection(setup_database):
+    """One shared connection for the whole session."""
+    async with test_engine.connect() as conn:
+        yield conn
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def db_connection(connection):
+    """Open a connection-level transaction rolled back after each test.
+
+    Rolling back the outer transaction replaces the old per-test
+    drop_all/create_all DDL: isolation comes from SAVEPOINTs instead of
+    rebuilding the schema, and the per-test cost is just BEGIN/ROLLBACK
+    on the session-wide connection.
+    """
+    global _test_connection
+
+    trans = await connection.begin()
+    _test_connection = connection
+    yield connection
+    _test_connection = None
+    await trans.rollback()
 
 
 @pytest_asyncio.fixture
-async def client(setup_database):
-    """Create test client."""
-    # Override database dependency
-    app.dependency_overrides[get_db] = override_get_db
+async def db_session(db_connection):
+    """Create a test database session inside the per-test transaction."""
+    session = _session_for(db_connection)
+    try:
+        yield session
+    finally:
+        await session.close()
 
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
 
-    # Clean up override
-    app.dependency_overrides.clear()
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create one test client for the whole session.
+
+    Per-test isolation lives entirely in the autouse db_connection
+    transaction, so there is no reason to rebuild the ASGI transport
+    for every test.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
@@ -159,41 +241,90 @@ def mock_rick_morty_data():
     }
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
+async def seeded_db_session(db_session, sample_character_data):
+    """db_session with the canonical Rick Sanchez row already present.
+
+    Read-only tests share this seed instead of each writing their own
+    copy inline; the insert lands inside the per-test transaction so it
+    disappears with the rollback.
+    """
+    await db_session.execute(insert(Character), [sample_character_data])
+    await db_session.commit()
+    return db_session
+
+
+@pytest.fixture(scope="session")
+def character_factory():
+    """Build Character row dicts, varying only the interesting fields."""
+    image_url = "https://example.com/image.jpg"
+
+    def make(id, name, status="Alive", species="Human", origin="Earth"):
+        return {
+            "id": id,
+            "name": name,
+            "status": status,
+            "species": species,
+            "origin_name": origin,
+            "image_url": image_url,
+        }
+
+    return make
+
+
+# Canonical sample row, built once; the fixture hands out a read-only
+# view so no test can mutate it for the others
+_SAMPLE_CHARACTER = {
+    "id": 1,
+    "name": "Rick Sanchez",
+    "status": "Alive",
+    "species": "Human",
+    "type": "",
+    "gender": "Male",
+    "origin_name": "Earth (C-137)",
+    "origin_url": "https://rickandmortyapi.com/api/location/1",
+    "location_name": "Citadel of Ricks",
+    "location_url": "https://rickandmortyapi.com/api/location/3",
+    "image_url": "https://rickandmortyapi.com/api/character/avatar/1.jpeg",
+    "episode_urls": '["https://rickandmortyapi.com/api/episode/1"]',
+    "api_url": "https://rickandmortyapi.com/api/character/1",
+}
+
+
+@pytest.fixture(scope="session")
 def sample_character_data():
     """Sample character data for testing."""
-    return {
-        "id": 1,
-        "name": "Rick Sanchez",
-        "status": "Alive",
-        "species": "Human",
-        "type": "",
-        "gender": "Male",
-        "origin_name": "Earth (C-137)",
-        "origin_url": "https://rickandmortyapi.com/api/location/1",
-        "location_name": "Citadel of Ricks",
-        "location_url": "https://rickandmortyapi.com/api/location/3",
-        "image_url": "https://rickandmortyapi.com/api/character/avatar/1.jpeg",
-        "episode_urls": '["https://rickandmortyapi.com/api/episode/1"]',
-        "api_url": "https://rickandmortyapi.com/api/character/1",
-    }
+    return MappingProxyType(_SAMPLE_CHARACTER)
 
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest_asyncio.fixture(scope="session", autouse=True)
 async def setup_cache():
-    """Set up cache for testing."""
-    # Use test cache settings
+    """Connect the cache to the test Redis database once per session.
+
+    Previously function-scoped, which cost every test a Redis
+    connect/disconnect plus a full keyspace scan even when it never
+    touched the cache. The connection now happens once, under a test:
+    key prefix so a shared Redis instance is never polluted; tests that
+    write cache keys clean up after themselves via clean_cache.
+    """
+    # Use test cache settings; the key prefix is bound at import in
+    # app.cache, so rebind the module constant alongside the setting
     original_redis_url = settings.redis_url
+    original_cache_prefix = settings.cache_prefix
+    original_prefix_bytes = cache_module._PREFIX
     settings.redis_url = "redis://localhost:6379/15"  # Use test database
+    settings.cache_prefix = "test:"
+    cache_module._PREFIX = settings.cache_prefix.encode()
 
     cache_connected = False
     try:
         await cache.connect()
         cache_connected = True
+        # Drop leftovers from any previously aborted run
+        await cache.clear_pattern("*")
     except Exception:
         # Cache not available, disable cache for tests
         cache._connected = False
-        pass
 
     yield
 
@@ -207,3 +338,17 @@ async def setup_cache():
 
     # Restore original settings
     settings.redis_url = original_redis_url
+    settings.cache_prefix = original_cache_prefix
+    cache_module._PREFIX = original_prefix_bytes
+
+
+@pytest_asyncio.fixture
+async def clean_cache():
+    """Opt-in fixture clearing cache keys written by a test.
+
+    clear_pattern prepends the test: prefix installed by setup_cache,
+    so only this suite's keys are scanned and deleted.
+    """
+    yield
+    if cache._connected:
+        await cache.clear_pattern("*")
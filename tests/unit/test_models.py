@@ -1,10 +1,12 @@
 """Unit tests for data models."""
-from datetime import datetime
-
-import pytest
+from datetime import datetime, timezone
 
 from app.models import Character, FilteredCharacterResponse, HealthCheckResponse
 
+# Frozen timestamp: no per-test clock reads, and model outputs stay
+# byte-identical across runs
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class TestCharacter:
     """Test Character database model."""
@@ -41,7 +43,7 @@ class TestFilteredCharacterResponse:
             "species": "Human",
             "origin_name": "Earth (C-137)",
             "image_url": "https://example.com/image.jpg",
-            "created_at": datetime.utcnow(),
+            "created_at": _FIXED_TS,
         }
 
         response = FilteredCharacterResponse(**data)
@@ -61,7 +63,7 @@ class TestFilteredCharacterResponse:
             "species": "Human",
             "origin_name": "Earth (C-137)",
             "image_url": "https://example.com/image.jpg",
-            "created_at": datetime.utcnow(),
+            "created_at": _FIXED_TS,
         }
 
         response = FilteredCharacterResponse(**data)
@@ -79,7 +81,7 @@ class TestHealthCheckResponse:
         """Test health check response creation."""
         data = {
             "status": "healthy",
-            "timestamp": datetime.utcnow(),
+            "timestamp": _FIXED_TS,
             "version": "1.0.0",
             "checks": {
                 "database": {"status": "healthy"},
@@ -98,7 +100,7 @@ class TestHealthCheckResponse:
         """Test unhealthy health check response."""
         data = {
             "status": "unhealthy",
-            "timestamp": datetime.utcnow(),
+            "timestamp": _FIXED_TS,
             "version": "1.0.0",
             "checks": {
                 "database": {"status": "unhealthy", "error": "Connection failed"},
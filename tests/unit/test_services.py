@@ -1,54 +1,54 @@
 """Unit tests for services."""
-from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
 
 import pytest
+from sqlalchemy import insert
 
-from app.models import Character, FilteredCharacterResponse
+from app.models import Character
 from app.services import CharacterService
 
 
+def _fake_client(rows):
+    """Fake API client streaming the given pre-flattened row dicts.
+
+    Passed to sync_characters_from_api via its client parameter, which
+    avoids unittest.mock.patch's module-attribute rebinding per test.
+    """
+
+    async def iter_filtered_character_rows():
+        for row in rows:
+            yield row
+
+    return SimpleNamespace(iter_filtered_character_rows=iter_filtered_character_rows)
+
+
 class TestCharacterService:
     """Test CharacterService."""
 
-    @pytest.mark.asyncio
-    async def test_get_characters_empty_db(self, db_session):
+    async def test_get_characters_empty_db(self, db_session, clean_cache):
         """Test getting characters from empty database."""
         characters, total = await CharacterService.get_characters(db_session)
 
         assert characters == []
         assert total == 0
 
-    @pytest.mark.asyncio
-    async def test_get_characters_with_data(self, db_session, sample_character_data):
+    async def test_get_characters_with_data(self, seeded_db_session, clean_cache):
         """Test getting characters with data in database."""
-        # Add a character to the database
-        character = Character(**sample_character_data)
-        db_session.add(character)
-        await db_session.commit()
-
-        characters, total = await CharacterService.get_characters(db_session)
+        characters, total = await CharacterService.get_characters(seeded_db_session)
 
         assert len(characters) == 1
         assert total == 1
         assert characters[0].id == 1
         assert characters[0].name == "Rick Sanchez"
 
-    @pytest.mark.asyncio
-    async def test_get_characters_pagination(self, db_session):
+    async def test_get_characters_pagination(
+        self, db_session, character_factory, clean_cache
+    ):
         """Test character pagination."""
-        # Add multiple characters
-        for i in range(5):
-            character = Character(
-                id=i + 1,
-                name=f"Character {i + 1}",
-                status="Alive",
-                species="Human",
-                origin_name="Earth",
-                image_url="https://example.com/image.jpg",
-            )
-            db_session.add(character)
-        await db_session.commit()
+        # Seed via one Core executemany; the test never touches these
+        # rows as ORM objects
+        rows = [character_factory(i + 1, f"Character {i + 1}") for i in range(5)]
+        await db_session.execute(insert(Character), rows)
 
         # Test pagination
         characters, total = await CharacterService.get_characters(
@@ -60,95 +60,55 @@ class TestCharacterService:
         assert characters[0].id == 3
         assert characters[1].id == 4
 
-    @pytest.mark.asyncio
-    async def test_get_characters_sorting(self, db_session):
+    @pytest.mark.parametrize(
+        "order,expected",
+        [
+            ("asc", ["Alice", "Bob", "Charlie"]),
+            ("desc", ["Charlie", "Bob", "Alice"]),
+        ],
+    )
+    async def test_get_characters_sorting(
+        self, db_session, character_factory, order, expected, clean_cache
+    ):
         """Test character sorting."""
-        # Add characters in random order
-        names = ["Charlie", "Alice", "Bob"]
-        for i, name in enumerate(names):
-            character = Character(
-                id=i + 1,
-                name=name,
-                status="Alive",
-                species="Human",
-                origin_name="Earth",
-                image_url="https://example.com/image.jpg",
-            )
-            db_session.add(character)
-        await db_session.commit()
-
-        # Test sorting by name ascending
-        characters, total = await CharacterService.get_characters(
-            db_session, sort_by="name", sort_order="asc"
-        )
-
-        assert len(characters) == 3
-        assert characters[0].name == "Alice"
-        assert characters[1].name == "Bob"
-        assert characters[2].name == "Charlie"
+        # Seed in random order via one Core executemany
+        rows = [
+            character_factory(i + 1, name)
+            for i, name in enumerate(["Charlie", "Alice", "Bob"])
+        ]
+        await db_session.execute(insert(Character), rows)
 
-        # Test sorting by name descending
         characters, total = await CharacterService.get_characters(
-            db_session, sort_by="name", sort_order="desc"
+            db_session, sort_by="name", sort_order=order
         )
 
-        assert characters[0].name == "Charlie"
-        assert characters[1].name == "Bob"
-        assert characters[2].name == "Alice"
+        assert [char.name for char in characters] == expected
 
-    @pytest.mark.asyncio
-    async def test_get_character_by_id(self, db_session, sample_character_data):
+    async def test_get_character_by_id(self, seeded_db_session, clean_cache):
         """Test getting character by ID."""
-        # Add a character to the database
-        character = Character(**sample_character_data)
-        db_session.add(character)
-        await db_session.commit()
-
         # Test getting existing character
-        result = await CharacterService.get_character_by_id(db_session, 1)
+        result = await CharacterService.get_character_by_id(seeded_db_session, 1)
 
         assert result is not None
         assert result.id == 1
         assert result.name == "Rick Sanchez"
 
         # Test getting non-existent character
-        result = await CharacterService.get_character_by_id(db_session, 999)
+        result = await CharacterService.get_character_by_id(seeded_db_session, 999)
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_get_stats(self, db_session):
+    async def test_get_stats(self, db_session, character_factory, clean_cache):
         """Test getting character statistics."""
-        # Add test characters
-        characters_data = [
-            {
-                "id": 1,
-                "name": "Rick",
-                "status": "Alive",
-                "species": "Human",
-                "origin_name": "Earth",
-            },
-            {
-                "id": 2,
-                "name": "Morty",
-                "status": "Alive",
-                "species": "Human",
-                "origin_name": "Earth",
-            },
-            {
-                "id": 3,
-                "name": "Alien",
-                "status": "Dead",
-                "species": "Alien",
-                "origin_name": "Mars",
-            },
+        # Seed via one Core executemany
+        rows = [
+            character_factory(1, "Rick"),
+            character_factory(2, "Morty"),
+            character_factory(
+                3, "Alien", status="Dead", species="Alien", origin="Mars"
+            ),
         ]
-
-        for char_data in characters_data:
-            char_data["image_url"] = "https://example.com/image.jpg"
-            character = Character(**char_data)
-            db_session.add(character)
-        await db_session.commit()
+        await db_session.execute(insert(Character), rows)
 
         stats = await CharacterService.get_stats(db_session)
 
@@ -159,30 +119,15 @@ class TestCharacterService:
         assert stats["status_breakdown"]["Dead"] == 1
         assert "last_sync" in stats
 
-    @pytest.mark.asyncio
-    @patch("app.services.rick_morty_client.get_all_filtered_characters")
-    async def test_sync_characters_from_api(self, mock_api_call, db_session):
+    async def test_sync_characters_from_api(
+        self, db_session, sample_character_data, clean_cache
+    ):
         """Test syncing characters from API."""
-        # Mock API response
-        mock_character = AsyncMock()
-        mock_character.id = 1
-        mock_character.name = "Rick Sanchez"
-        mock_character.status = "Alive"
-        mock_character.species = "Human"
-        mock_character.type = ""
-        mock_character.gender = "Male"
-        mock_character.origin.name = "Earth (C-137)"
-        mock_character.origin.url = "https://rickandmortyapi.com/api/location/1"
-        mock_character.location.name = "Citadel of Ricks"
-        mock_character.location.url = "https://rickandmortyapi.com/api/location/3"
-        mock_character.image = "https://rickandmortyapi.com/api/character/avatar/1.jpeg"
-        mock_character.episode = ["https://rickandmortyapi.com/api/episode/1"]
-        mock_character.url = "https://rickandmortyapi.com/api/character/1"
-
-        mock_api_call.return_value = [mock_character]
-
-        # Test sync
-        synced_count = await CharacterService.sync_characters_from_api(db_session)
+        # Test sync with an injected fake client; the frozen fixture is
+        # copied since the sync path binds rows as plain dicts
+        synced_count = await CharacterService.sync_characters_from_api(
+            db_session, client=_fake_client([dict(sample_character_data)])
+        )
 
         assert synced_count == 1
 
@@ -192,37 +137,22 @@ class TestCharacterService:
         assert characters[0].id == 1
         assert characters[0].name == "Rick Sanchez"
 
-    @pytest.mark.asyncio
-    @patch("app.services.rick_morty_client.get_all_filtered_characters")
     async def test_sync_characters_update_existing(
-        self, mock_api_call, db_session, sample_character_data
+        self, db_session, sample_character_data, clean_cache
     ):
         """Test updating existing characters during sync."""
         # Add existing character
         character = Character(**sample_character_data)
         db_session.add(character)
-        await db_session.commit()
-
-        # Mock API response with updated data
-        mock_character = AsyncMock()
-        mock_character.id = 1
-        mock_character.name = "Rick Sanchez Updated"
-        mock_character.status = "Alive"
-        mock_character.species = "Human"
-        mock_character.type = ""
-        mock_character.gender = "Male"
-        mock_character.origin.name = "Earth (C-137)"
-        mock_character.origin.url = "https://rickandmortyapi.com/api/location/1"
-        mock_character.location.name = "Citadel of Ricks"
-        mock_character.location.url = "https://rickandmortyapi.com/api/location/3"
-        mock_character.image = "https://rickandmortyapi.com/api/character/avatar/1.jpeg"
-        mock_character.episode = ["https://rickandmortyapi.com/api/episode/1"]
-        mock_character.url = "https://rickandmortyapi.com/api/character/1"
-
-        mock_api_call.return_value = [mock_character]
+        await db_session.flush()
+
+        # Fake API response with updated data
+        updated_row = dict(sample_character_data, name="Rick Sanchez Updated")
 
         # Test sync
-        synced_count = await CharacterService.sync_characters_from_api(db_session)
+        synced_count = await CharacterService.sync_characters_from_api(
+            db_session, client=_fake_client([updated_row])
+        )
 
         assert synced_count == 1
 